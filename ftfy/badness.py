@@ -14,6 +14,7 @@ followed immediately by currency symbols.
 
 import warnings
 import re
+from functools import lru_cache
 
 
 # There are only a few hundred characters that occur in known UTF-8 mojibake, and we can
@@ -406,6 +407,11 @@ def badness(text: str) -> int:
     character sequences. A badness greater than 0 indicates that some of it
     seems to be mojibake.
     """
+    if text.isascii():
+        # Every sequence that BADNESS_RE can match contains at least one
+        # non-ASCII character, so we can skip the regex scan entirely for
+        # ASCII text. str.isascii() is a single pass that runs in C.
+        return 0
     return len(BADNESS_RE.findall(text))
 
 
@@ -417,4 +423,23 @@ def is_bad(text: str) -> bool:
     is found to a regex instead of counting matches. Note that as strings get
     longer, they have a higher chance of returning True for `is_bad(string)`.
     """
+    # As in `badness`, ASCII text can't match BADNESS_RE, and the C-level
+    # ASCII check is much faster than running the regex to find that out.
+    if text.isascii():
+        return False
+    if len(text) <= _MAX_CACHED_BADNESS_LENGTH:
+        return _is_bad_cached(text)
+    return bool(BADNESS_RE.search(text))
+
+
+# The same short string is often checked for badness more than once: for
+# example, `decode_inconsistent_utf8` tests each suspicious substring with
+# `is_bad`, then hands it to `fix_encoding`, which checks it again. Cache
+# the answers for short strings; long ones are unlikely to repeat and would
+# hold on to too much memory.
+_MAX_CACHED_BADNESS_LENGTH = 256
+
+
+@lru_cache(maxsize=4096)
+def _is_bad_cached(text: str) -> bool:
     return bool(BADNESS_RE.search(text))
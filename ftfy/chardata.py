@@ -9,10 +9,14 @@ import html
 import itertools
 import re
 import unicodedata
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 # These are the encodings we will try to fix in ftfy, in the
 # order that they should be tried.
-CHARMAP_ENCODINGS = [
+CHARMAP_ENCODINGS = (
     "latin-1",
     "sloppy-windows-1252",
     "sloppy-windows-1251",
@@ -23,11 +27,17 @@ CHARMAP_ENCODINGS = [
     "iso-8859-2",
     "macroman",
     "cp437",
-]
+)
 
 SINGLE_QUOTE_RE = re.compile("[\u02bc\u2018-\u201b]")
 DOUBLE_QUOTE_RE = re.compile("[\u201c-\u201f]")
 
+# A translate mapping covering the same characters as the quote regexes
+# above, so that `uncurl_quotes` can replace all of them in one pass.
+CURLY_QUOTE_MAP = {ord(char): "'" for char in "\u02bc\u2018\u2019\u201a\u201b"} | {
+    ord(char): '"' for char in "\u201c\u201d\u201e\u201f"
+}
+
 
 def _build_regexes() -> dict[str, re.Pattern[str]]:
     """
@@ -91,6 +101,11 @@ def possible_encoding(text: str, encoding: str) -> bool:
     In other words, check whether it can be encoded in that encoding, possibly
     sloppily.
     """
+    if encoding == "ascii":
+        # str.isascii() is a fast C-level check, and asking about ASCII is
+        # the most common case, the one that lets us skip fixing a string
+        # entirely.
+        return text.isascii()
     return bool(ENCODING_REGEXES[encoding].match(text))
 
 
@@ -100,23 +115,41 @@ def _build_control_char_mapping() -> dict[int, None]:
     See :func:`ftfy.fixes.remove_control_chars` for a description of these
     codepoint ranges and why they should be removed.
     """
-    control_chars: dict[int, None] = {}
+    return dict.fromkeys(
+        itertools.chain(
+            range(0x00, 0x09),
+            [0x0B],
+            range(0x0E, 0x20),
+            [0x7F],
+            range(0x206A, 0x2070),
+            [0xFEFF],
+            range(0xFFF9, 0xFFFD),
+        )
+    )
 
-    for i in itertools.chain(
-        range(0x00, 0x09),
-        [0x0B],
-        range(0x0E, 0x20),
-        [0x7F],
-        range(0x206A, 0x2070),
-        [0xFEFF],
-        range(0xFFF9, 0xFFFD),
-    ):
-        control_chars[i] = None
 
-    return control_chars
+CONTROL_CHARS = _build_control_char_mapping()
 
+# The control-character and curly-quote mappings apply to disjoint sets of
+# characters, so when both fixes are enabled (and we don't need to report
+# them as separate steps), they can run as a single str.translate pass.
+CONTROL_CHARS_AND_QUOTES = {**CONTROL_CHARS, **CURLY_QUOTE_MAP}
 
-CONTROL_CHARS = _build_control_char_mapping()
+
+def translate_probe(table: Mapping[int, str | None]) -> re.Pattern[str]:
+    """
+    Compile a regex matching any character that a translate mapping would
+    change. Searching with this is much cheaper than running str.translate
+    on text that the mapping doesn't affect, and it lets a fixer return its
+    input unchanged -- the same object -- in the common no-op case.
+    """
+    chars = "".join(chr(codepoint) for codepoint in sorted(table))
+    return re.compile(f"[{re.escape(chars)}]")
+
+
+CONTROL_CHARS_RE = translate_probe(CONTROL_CHARS)
+CONTROL_CHARS_AND_QUOTES_RE = translate_probe(CONTROL_CHARS_AND_QUOTES)
+CURLY_QUOTE_RE = translate_probe(CURLY_QUOTE_MAP)
 
 
 # Recognize UTF-8 sequences that would be valid if it weren't for a b'\xa0'
@@ -188,11 +221,32 @@ LOSSY_UTF8_RE = re.compile(
 )
 
 
+# This regex matches bytes that could begin a multi-byte UTF-8 sequence,
+# including byte C0, which the utf-8-variants codec accepts as the start of
+# Java's over-long encoding of U+0000. If none of these bytes appear in a
+# byte string, decoding it as (any variant of) UTF-8 cannot succeed, and we
+# can skip the attempt.
+UTF8_LEAD_RE = re.compile(b"[\xc0-\xf4]")
+
+
 # This regex matches C1 control characters, which occupy some of the positions
 # in the Latin-1 character map that Windows assigns to other characters instead.
 C1_CONTROL_RE = re.compile(r"[\x80-\x9f]")
 
 
+def _build_c1_control_map() -> dict[int, str]:
+    """
+    Build a translate mapping from C1 control characters to the characters
+    that Windows-1252 assigns to the same byte values (or, for the five
+    bytes Windows-1252 leaves unassigned, to themselves, which is what the
+    sloppy-windows-1252 codec does).
+    """
+    return {code: bytes([code]).decode("sloppy-windows-1252") for code in range(0x80, 0xA0)}
+
+
+C1_CONTROL_MAP = _build_c1_control_map()
+
+
 # A translate mapping that breaks ligatures made of Latin letters. While
 # ligatures may be important to the representation of other languages, in Latin
 # letters they tend to represent a copy/paste error. It omits ligatures such
@@ -229,6 +283,8 @@ LIGATURES = {
     ord("ﬆ"): "st",
 }
 
+LIGATURES_RE = translate_probe(LIGATURES)
+
 
 def _build_width_map() -> dict[int, str]:
     """
@@ -248,6 +304,48 @@ def _build_width_map() -> dict[int, str]:
 
 
 WIDTH_MAP = _build_width_map()
+WIDTH_RE = translate_probe(WIDTH_MAP)
+
+# Like CONTROL_CHARS_AND_QUOTES, a fusion of translate tables so that several
+# consecutive fixers can run as one str.translate pass. fix_c1_controls,
+# fix_latin_ligatures, and fix_character_width are adjacent in the fixer
+# sequence, their tables cover disjoint characters, and no character any of
+# them outputs is rewritten by another of the three (the only outputs that
+# appear as keys at all are the C1 map's identity entries for the five bytes
+# Windows-1252 leaves unassigned), so one fused pass is equivalent to the
+# three in order.
+C1_LIGATURES_AND_WIDTH = {**C1_CONTROL_MAP, **LIGATURES, **WIDTH_MAP}
+C1_LIGATURES_AND_WIDTH_RE = translate_probe(C1_LIGATURES_AND_WIDTH)
+
+
+def _build_fixer_trigger_regex() -> re.Pattern[str]:
+    """
+    Compile a regex matching any character that could trigger any of the
+    per-character fixers (the ones that run after encoding fixes in
+    :func:`ftfy.fix_and_explain`). It's the union of the translate tables
+    above, plus the line-break characters, ESC, and the surrogate range.
+
+    A single search with this pattern can prove that the whole cascade of
+    fixers has nothing to do, replacing one scan per fixer with one scan
+    total.
+    """
+    codepoints = (
+        set(CONTROL_CHARS)
+        | set(C1_CONTROL_MAP)
+        | set(CURLY_QUOTE_MAP)
+        | set(LIGATURES)
+        | set(WIDTH_MAP)
+        # fix_line_breaks: CR, LINE SEPARATOR, PARAGRAPH SEPARATOR. (NEXT
+        # LINE, \x85, is already in C1_CONTROL_MAP.)
+        | {0x0D, 0x2028, 0x2029}
+        # fix_surrogates
+        | set(range(0xD800, 0xE000))
+    )
+    chars = "".join(chr(codepoint) for codepoint in sorted(codepoints))
+    return re.compile(f"[{re.escape(chars)}]")
+
+
+FIXER_TRIGGER_RE = _build_fixer_trigger_regex()
 
 
 # Character classes that help us pinpoint embedded mojibake. These can
@@ -21,16 +21,20 @@ import ftfy
 from ftfy.badness import is_bad
 from ftfy.chardata import (
     ALTERED_UTF8_RE,
+    C1_CONTROL_MAP,
     C1_CONTROL_RE,
     CONTROL_CHARS,
-    DOUBLE_QUOTE_RE,
+    CONTROL_CHARS_RE,
+    CURLY_QUOTE_MAP,
+    CURLY_QUOTE_RE,
     HTML_ENTITIES,
     HTML_ENTITY_RE,
     LIGATURES,
+    LIGATURES_RE,
     LOSSY_UTF8_RE,
-    SINGLE_QUOTE_RE,
     UTF8_DETECTOR_RE,
     WIDTH_MAP,
+    WIDTH_RE,
 )
 
 
@@ -76,8 +80,9 @@ def _unescape_fixup(match: Match[str]) -> str:
     if possible.
     """
     text = match.group(0)
-    if text in HTML_ENTITIES:
-        return HTML_ENTITIES[text]
+    entity = HTML_ENTITIES.get(text)
+    if entity is not None:
+        return entity
     elif text.startswith("&#"):
         unescaped: str = html.unescape(text)
 
@@ -136,6 +141,10 @@ def unescape_html(text: str) -> str:
         >>> unescape_html('&ntilde; &Ntilde; &NTILDE; &nTILDE;')
         'ñ Ñ Ñ &nTILDE;'
     """
+    if "&" not in text:
+        # A single-character `in` check runs at memchr speed, and saves us
+        # from scanning entity-free text with the regex.
+        return text
     return HTML_ENTITY_RE.sub(_unescape_fixup, text)
 
 
@@ -152,6 +161,11 @@ def remove_terminal_escapes(text: str) -> str:
         ... ))
         I'm blue, da ba dee da ba doo...
     """
+    if "\033" not in text:
+        # Escape sequences all start with the ESC character, and the vast
+        # majority of text contains none, so check for that one character
+        # before involving the regex.
+        return text
     return ANSI_RE.sub("", text)
 
 
@@ -162,7 +176,9 @@ def uncurl_quotes(text: str) -> str:
         >>> print(uncurl_quotes('\u201chere\u2019s a test\u201d'))
         "here's a test"
     """
-    return SINGLE_QUOTE_RE.sub("'", DOUBLE_QUOTE_RE.sub('"', text))
+    if text.isascii() or not CURLY_QUOTE_RE.search(text):
+        return text
+    return text.translate(CURLY_QUOTE_MAP)
 
 
 def fix_latin_ligatures(text: str) -> str:
@@ -180,6 +196,8 @@ def fix_latin_ligatures(text: str) -> str:
         >>> print(fix_latin_ligatures("ﬂuﬃeﬆ"))
         fluffiest
     """
+    if text.isascii() or not LIGATURES_RE.search(text):
+        return text
     return text.translate(LIGATURES)
 
 
@@ -200,6 +218,8 @@ def fix_character_width(text: str) -> str:
         >>> print(fix_character_width("Ｕﾀｰﾝ"))   # this means "U-turn"
         Uターン
     """
+    if text.isascii() or not WIDTH_RE.search(text):
+        return text
     return text.translate(WIDTH_MAP)
 
 
@@ -324,6 +344,8 @@ def remove_control_chars(text: str) -> str:
     - Tag characters, because they are now used in emoji sequences such as
       "Flag of Wales"
     """
+    if not CONTROL_CHARS_RE.search(text):
+        return text
     return text.translate(CONTROL_CHARS)
 
 
@@ -498,13 +520,11 @@ def decode_inconsistent_utf8(text: str) -> str:
     return UTF8_DETECTOR_RE.sub(fix_embedded_mojibake, text)
 
 
-def _c1_fixer(match: Match[str]) -> str:
-    return match.group(0).encode("latin-1").decode("sloppy-windows-1252")
-
-
 def fix_c1_controls(text: str) -> str:
     """
     If text still contains C1 control characters, treat them as their
     Windows-1252 equivalents. This matches what Web browsers do.
     """
-    return C1_CONTROL_RE.sub(_c1_fixer, text)
+    if text.isascii() or not C1_CONTROL_RE.search(text):
+        return text
+    return text.translate(C1_CONTROL_MAP)
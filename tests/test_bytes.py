@@ -34,6 +34,15 @@ def test_guess_bytes_null():
     assert result_encoding == "utf-8-variants"
 
 
+def test_guess_bytes_cesu8():
+    # Byte 0xED encodes UTF-16 surrogates in CESU-8; the byte probe in
+    # guess_bytes routes such input to the utf-8-variants codec.
+    cesu8_emoji = b"cat: \xed\xa0\xbd\xed\xb0\xb1"
+    result_str, result_encoding = guess_bytes(cesu8_emoji)
+    assert result_str == "cat: \U0001f431"
+    assert result_encoding == "utf-8-variants"
+
+
 def test_incomplete_sequences():
     test_bytes = b"surrogates: \xed\xa0\x80\xed\xb0\x80 / null: \xc0\x80"
     test_string = "surrogates: \U00010000 / null: \x00"
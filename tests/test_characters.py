@@ -1,7 +1,9 @@
 from ftfy import (
+    TextFixerConfig,
     fix_and_explain,
     fix_encoding,
     fix_text,
+    fix_text_segment,
 )
 from ftfy.chardata import possible_encoding
 from ftfy.fixes import fix_surrogates, remove_control_chars
@@ -46,6 +48,40 @@ def test_surrogates():
     assert fix_surrogates("\ud800\udc00") == "\U00010000"
 
 
+def test_normalization():
+    # Combining characters still get composed: the NFC quick-check that skips
+    # unicodedata.normalize for already-normalized text must not skip text
+    # that actually needs normalizing.
+    fixed, plan = fix_and_explain("ce\u0301leste")
+    assert fixed == "céleste"
+    assert plan == [("normalize", "NFC")]
+
+    # Text that is already NFC passes through with no normalize step.
+    fixed, plan = fix_and_explain("céleste")
+    assert fixed == "céleste"
+    assert plan == []
+
+
+def test_encoding_flags_without_explain():
+    # fix_text skips building explanations, but it must still pass the config
+    # through to the encoding fixer: a non-default flag like
+    # replace_lossy_sequences has to change the result the same way it does
+    # on the explaining path.
+    mojibake = "lossy: â€œquoteâ€\x9d �"
+    config = TextFixerConfig(replace_lossy_sequences=False)
+    expected = 'lossy: "quote" '
+    assert fix_text(mojibake, config) == expected
+    assert fix_and_explain(mojibake, config._replace(explain=True)).text == expected
+
+    # The segment cache is keyed on the config, so the cached path must give
+    # the same answer, including on a repeated (cache-hit) call.
+    assert fix_text_segment(mojibake, config) == expected
+    assert fix_text_segment(mojibake, config) == expected
+
+    # With the default config, the lossy sequence is replaced instead.
+    assert fix_text(mojibake) == 'lossy: "quote" �'
+
+
 def test_color_escapes():
     fixed, plan = fix_and_explain("\001\033[36;44mfoo")
     print(plan)